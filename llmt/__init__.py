@@ -20,7 +20,14 @@ from .functions import (
     RawFunctionResult,
     WrapperConfig,
 )
-from .openai_types import FinalResponseMessage, FunctionCall, GenericMessage, Message
+from .openai_types import (
+    AnyFunctionCall,
+    FinalResponseMessage,
+    FunctionCall,
+    FunctionCallObject,
+    GenericMessage,
+    Message,
+)
 from .parsers import ArgSchemaParser, defargparsers
 
 __version__ = "0.0.5"
@@ -54,6 +61,8 @@ __all__ = [
     "WrapperConfig",
     "FinalResponseMessage",
     "FunctionCall",
+    "FunctionCallObject",
+    "AnyFunctionCall",
     "GenericMessage",
     "Message",
 ]
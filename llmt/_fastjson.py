@@ -0,0 +1,18 @@
+"""JSON helpers that use orjson when it is installed, and the stdlib otherwise"""
+
+from __future__ import annotations
+
+from typing import Any
+
+try:
+    from orjson import dumps, loads
+except ImportError:
+    import json
+    from json import loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to UTF-8 encoded JSON, matching orjson.dumps"""
+        return json.dumps(obj).encode()
+
+
+__all__ = ["dumps", "loads"]
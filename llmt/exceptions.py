@@ -77,11 +77,13 @@ class InvalidJsonError(OpenAIFunctionsError):
         Args:
             response (str): The response that was not valid JSON
         """
-        super().__init__(
-            f"OpenAI returned invalid (perhaps incomplete) JSON: {response}"
-        )
+        super().__init__(response)
         self.response = response
 
+    def __str__(self) -> str:
+        # Formatted on demand, since callers often catch this without printing it
+        return f"OpenAI returned invalid (perhaps incomplete) JSON: {self.response}"
+
 
 class BrokenSchemaError(OpenAIFunctionsError):
     """The OpenAI response did not match the schema.
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any, Protocol, TYPE_CHECKING, runtime_checkable
 
@@ -52,7 +53,18 @@ class OpenAIFunction(Protocol):
         ...  # pylint: disable=unnecessary-ellipsis
 
 
-@dataclass
+def _json_default(value: Any) -> Any:
+    """Serialize read-only mappings (e.g. MappingProxyType) as JSON objects
+
+    Raises:
+        TypeError: If the value is not a mapping
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
 class RawFunctionResult:
     """A raw function result"""
 
@@ -71,13 +83,13 @@ class RawFunctionResult:
         """
         if self.serialize:
             try:
-                return json.dumps(self.result)
+                return json.dumps(self.result, default=_json_default)
             except TypeError as error:
                 raise NonSerializableOutputError(self.result) from error
         return str(self.result)
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionResult:
     """A result of a function's execution"""
 
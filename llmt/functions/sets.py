@@ -1,19 +1,67 @@
 from __future__ import annotations
 
-import json
 from abc import ABC, abstractmethod
-from functools import partial
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Callable, TYPE_CHECKING, overload
 
+from .._fastjson import dumps as _dumps, loads as _loads
 from ..exceptions import FunctionNotFoundError, InvalidJsonError
 from .functions import FunctionResult, OpenAIFunction, RawFunctionResult
 from ..json_type import JsonType
-from ..openai_types import FunctionCall
+from ..openai_types import AnyFunctionCall
 from .wrapper import FunctionWrapper, WrapperConfig
 
 if TYPE_CHECKING:
     from ..json_type import JsonType
-    from ..openai_types import FunctionCall
+    from ..openai_types import AnyFunctionCall
+
+
+def _load_arguments(raw: str) -> dict[str, JsonType]:
+    """Decode tool-call arguments, requiring a JSON object
+
+    Raises:
+        ValueError: If the arguments are not valid JSON or not a JSON object
+    """
+    arguments = _loads(raw)
+    if not isinstance(arguments, dict):
+        raise ValueError(f"Expected a JSON object, got {type(arguments).__name__}")
+    return arguments
+
+
+# Payloads sent for argument-less calls, answered without running the decoder
+_EMPTY_ARGUMENTS = frozenset({"{}", "", None})
+
+
+def _unpack_call(call: AnyFunctionCall) -> tuple[str, str]:
+    """Get the name and raw arguments of a function call, mapping or object"""
+    if isinstance(call, Mapping):
+        return call["name"], call["arguments"]
+    return call.name, call.arguments
+
+
+def _parse_arguments(raw_arguments: str) -> dict[str, JsonType]:
+    """Parse the arguments of a function call
+
+    Raises:
+        InvalidJsonError: If the arguments are not a valid JSON object
+    """
+    if raw_arguments in _EMPTY_ARGUMENTS:
+        return {}
+    try:
+        return _load_arguments(raw_arguments)
+    except ValueError as err:
+        raise InvalidJsonError(raw_arguments) from err
+
+
+@lru_cache(maxsize=32)
+def _wrapper_config(
+    save_return: bool, serialize: bool, remove_call: bool, interpret_as_response: bool
+) -> WrapperConfig:
+    """Get a shared WrapperConfig for the given return value treatment flags"""
+    return WrapperConfig(
+        None, save_return, serialize, remove_call, interpret_as_response
+    )
 
 
 class FunctionSet(ABC):
@@ -25,21 +73,35 @@ class FunctionSet(ABC):
         """Get the functions schema"""
 
     @abstractmethod
-    def run_function(self, input_data: FunctionCall) -> FunctionResult:
+    def run_function(self, input_data: AnyFunctionCall) -> FunctionResult:
         """Run the function
 
         Args:
-            input_data (FunctionCall): The function call
+            input_data (AnyFunctionCall): The function call
 
         Raises:
             FunctionNotFoundError: If the function is not found
         """
 
-    def __call__(self, input_data: FunctionCall) -> JsonType:
+    def run_functions(self, calls: list[AnyFunctionCall]) -> list[FunctionResult]:
+        """Run several functions, in order
+
+        Args:
+            calls (list[AnyFunctionCall]): The function calls
+
+        Returns:
+            list[FunctionResult]: The function outputs, one per call
+
+        Raises:
+            FunctionNotFoundError: If a function is not found
+        """
+        return [self.run_function(call) for call in calls]
+
+    def __call__(self, input_data: AnyFunctionCall) -> JsonType:
         """Run the function with the given input data
 
         Args:
-            input_data (FunctionCall): The input data from OpenAI
+            input_data (AnyFunctionCall): The input data from OpenAI
 
         Returns:
             JsonType: Your function's raw result
@@ -120,8 +182,8 @@ class BaseFunctionSet(FunctionSet):
             self._add_function(
                 FunctionWrapper(
                     function,
-                    WrapperConfig(
-                        None, save_return, serialize, remove_call, interpret_as_response
+                    _wrapper_config(
+                        save_return, serialize, remove_call, interpret_as_response
                     ),
                     name=name,
                     description=description,
@@ -129,15 +191,18 @@ class BaseFunctionSet(FunctionSet):
             )
             return function
 
-        return partial(
-            self.add_function,
-            name=name,
-            description=description,
-            save_return=save_return,
-            serialize=serialize,
-            remove_call=remove_call,
-            interpret_as_response=interpret_as_response,
-        )
+        def decorator(function: Callable[..., Any]) -> Callable[..., Any]:
+            return self.add_function(
+                function,
+                name=name,
+                description=description,
+                save_return=save_return,
+                serialize=serialize,
+                remove_call=remove_call,
+                interpret_as_response=interpret_as_response,
+            )
+
+        return decorator
 
 
 class OpenAIFunctionSet(BaseFunctionSet):
@@ -152,7 +217,20 @@ class OpenAIFunctionSet(BaseFunctionSet):
         self,
         functions: list[OpenAIFunction] | None = None,
     ) -> None:
-        self.functions = functions or []
+        self._functions: dict[str, OpenAIFunction] = {
+            function.name: function for function in functions or []
+        }
+        self._schema_cache: list[JsonType] | None = None
+        self._schema_json: bytes | None = None
+
+    @property
+    def functions(self) -> list[OpenAIFunction]:
+        """Get the functions in this set, in the order they were added
+
+        Returns:
+            list[OpenAIFunction]: A new list of the functions
+        """
+        return list(self._functions.values())
 
     @property
     def functions_schema(self) -> list[JsonType]:
@@ -161,13 +239,30 @@ class OpenAIFunctionSet(BaseFunctionSet):
         Returns:
             JsonType: The schema of all the available functions
         """
-        return [function.schema for function in self.functions]
+        if self._schema_cache is None:
+            self._schema_cache = [
+                function.schema for function in self._functions.values()
+            ]
+        return self._schema_cache
 
-    def run_function(self, input_data: FunctionCall) -> FunctionResult:
+    @property
+    def functions_schema_json(self) -> bytes:
+        """Get the functions schema serialized as a JSON array
+
+        Useful for transports that write the request body themselves.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON of `functions_schema`
+        """
+        if self._schema_json is None:
+            self._schema_json = _dumps(self.functions_schema)
+        return self._schema_json
+
+    def run_function(self, input_data: AnyFunctionCall) -> FunctionResult:
         """Run the function
 
         Args:
-            input_data (FunctionCall): The function call
+            input_data (AnyFunctionCall): The function call
 
         Returns:
             FunctionResult: The function output
@@ -176,11 +271,9 @@ class OpenAIFunctionSet(BaseFunctionSet):
             FunctionNotFoundError: If the function is not found
             InvalidJsonError: If the arguments are not valid JSON
         """
-        function = self.find_function(input_data["name"])
-        try:
-            arguments = json.loads(input_data["arguments"])
-        except json.decoder.JSONDecodeError as err:
-            raise InvalidJsonError(input_data["arguments"]) from err
+        name, raw_arguments = _unpack_call(input_data)
+        function = self.find_function(name)
+        arguments = _parse_arguments(raw_arguments)
         result = self.get_function_result(function, arguments)
         return FunctionResult(
             function.name, result, function.remove_call, function.interpret_as_response
@@ -198,10 +291,10 @@ class OpenAIFunctionSet(BaseFunctionSet):
         Raises:
             FunctionNotFoundError: If the function is not found
         """
-        for function in self.functions:
-            if function.name == function_name:
-                return function
-        raise FunctionNotFoundError(function_name)
+        try:
+            return self._functions[function_name]
+        except KeyError:
+            raise FunctionNotFoundError(function_name) from None
 
     def get_function_result(
         self, function: OpenAIFunction, arguments: dict[str, JsonType]
@@ -225,7 +318,11 @@ class OpenAIFunctionSet(BaseFunctionSet):
     def _add_function(self, function: OpenAIFunction) -> None:
         """Add a function to the functionset
 
+        A function with the same name as an existing one replaces it.
+
         Args:
             function (OpenAIFunction): The function
         """
-        self.functions.append(function)
+        self._functions[function.name] = function
+        self._schema_cache = None
+        self._schema_json = None
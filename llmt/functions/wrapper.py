@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ..json_type import JsonType
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WrapperConfig:
     """Configuration for a FunctionWrapper, one that specifies the parsers for the
     arguments and the treatment of the return value.
@@ -14,7 +14,7 @@ from watchdog.events import FileSystemEventHandler
 from .functions.functions import FunctionResult, OpenAIFunction
 from .functions.sets import OpenAIFunctionSet
 from .json_type import JsonType
-from .openai_types import FunctionCall
+from .openai_types import AnyFunctionCall
 from .utils import logger
 from .consts import RESPONSE_TEMPLATE
 
@@ -326,12 +326,12 @@ class FunctionManager:
 
     def run_function(
         self,
-        function_call: FunctionCall,
+        function_call: AnyFunctionCall,
     ) -> FunctionResult:
         """Run a function.
 
         Args:
-            function_call (FunctionCall): The function call.
+            function_call (AnyFunctionCall): The function call.
 
         Raises:
             TypeError: If the function returns a None value.
@@ -340,3 +340,17 @@ class FunctionManager:
             FunctionResult: The function output.
         """
         return self.functions.run_function(function_call)
+
+    def run_functions(
+        self,
+        function_calls: list[AnyFunctionCall],
+    ) -> list[FunctionResult]:
+        """Run several functions, in order.
+
+        Args:
+            function_calls (list[AnyFunctionCall]): The function calls.
+
+        Returns:
+            list[FunctionResult]: The function outputs, one per call.
+        """
+        return self.functions.run_functions(function_calls)
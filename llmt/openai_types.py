@@ -25,6 +25,22 @@ class FunctionCall(TypedDict):
     arguments: str
 
 
+class FunctionCallObject(Protocol):
+    """A function call with attribute access, such as the openai SDK's
+    `Function` model on a tool call
+
+    Attributes:
+        name (str): The name of the function
+        arguments (str): The arguments of the function, in JSON format
+    """
+
+    name: str
+    arguments: str
+
+
+AnyFunctionCall = Union[FunctionCall, FunctionCallObject]
+
+
 class FinalResponseMessageType(TypedDict):
     """A type for OpenAI messages that are final responses"""
 
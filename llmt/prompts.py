@@ -128,14 +128,13 @@ def run_until_response(context, assistant, function_manager):
             message = {"role": "assistant", "tool_calls": tool_calls}
             context.append(message)
 
-            for tool_call in tool_calls:
+            results = function_manager.run_functions(
+                [tool_call.function for tool_call in tool_calls]
+            )
+
+            for tool_call, result in zip(tool_calls, results):
                 args = tool_call.function.arguments
                 fn_name = tool_call.function.name
-                function_call: FunctionCall = {
-                    "name": fn_name,
-                    "arguments": args,
-                }
-                result = function_manager.run_function(function_call)
                 message = {
                     "role": "tool",
                     "content": str(result.content),